@@ -188,7 +188,10 @@ def _isna(obj):
     -------
     boolean ndarray or boolean
     """
-    if is_scalar(obj):
+    if type(obj) is np.ndarray:
+        # fastpath for the most common case, skipping the checks below
+        return _isna_array(obj)
+    elif is_scalar(obj):
         return libmissing.checknull(obj)
     elif isinstance(obj, ABCMultiIndex):
         raise NotImplementedError("isna is not defined for MultiIndex")
@@ -249,6 +252,9 @@ def _isna_array(values: ArrayLike) -> npt.NDArray[np.bool_] | NDFrame:
     elif dtype.kind in "mM":
         # this is the NaT pattern
         result = values.view("i8") == iNaT
+    elif dtype.kind in "iub":
+        # these can never hold NaN; avoid np.isnan casting to float
+        result = np.zeros(values.shape, dtype=bool)
     else:
         result = np.isnan(values)
 
@@ -383,7 +389,7 @@ def notna(obj: object) -> bool | npt.NDArray[np.bool_] | NDFrame:
     1    False
     Name: 1, dtype: bool
     """
-    res = isna(obj)
+    res = _isna(obj)
     if isinstance(res, bool):
         return not res
     return ~res
@@ -429,7 +435,26 @@ def array_equivalent(
     >>> array_equivalent(np.array([1, np.nan, 2]), np.array([1, 2, np.nan]))
     False
     """
-    left, right = np.asarray(left), np.asarray(right)
+    if left is right and (
+        not strict_nan or (isinstance(left, np.ndarray) and left.dtype != object)
+    ):
+        # NaNs in matching locations are considered equivalent, so an object
+        #  is always equivalent to itself. With strict_nan, object arrays can
+        #  hold missing values that do not match each other, so compare them.
+        return True
+
+    # shape compat, checked before any conversion when possible
+    if (
+        hasattr(left, "shape")
+        and hasattr(right, "shape")
+        and left.shape != right.shape
+    ):
+        return False
+
+    if type(left) is not np.ndarray:
+        left = np.asarray(left)
+    if type(right) is not np.ndarray:
+        right = np.asarray(right)
 
     # shape compat
     if left.shape != right.shape:
@@ -453,13 +478,16 @@ def array_equivalent(
     if left.dtype.kind in "OSU" or right.dtype.kind in "OSU":
         # Note: `in "OSU"` is non-trivially faster than `in ["O", "S", "U"]`
         #  or `in ("O", "S", "U")`
+        if not left.size:
+            # shapes match, so both are empty
+            return True
         return _array_equivalent_object(left, right, strict_nan)
 
     # NaNs can occur in float and complex arrays.
     if left.dtype.kind in "fc":
         if not (left.size and right.size):
             return True
-        return ((left == right) | (isna(left) & isna(right))).all()
+        return _array_equivalent_float(left, right)
 
     elif left.dtype.kind in "mM" or right.dtype.kind in "mM":
         # datetime64, timedelta64, Period
@@ -479,7 +507,15 @@ def array_equivalent(
 
 
 def _array_equivalent_float(left: np.ndarray, right: np.ndarray) -> bool:
-    return bool(((left == right) | (np.isnan(left) & np.isnan(right))).all())
+    # Without any unequal positions there can be no NaNs, so the isnan masks
+    #  are only built when needed. The arrays are then equivalent if the
+    #  unequal positions are exactly those where both sides are NaN.
+    neq = left != right
+    if not neq.any():
+        return True
+    both_nan = np.isnan(left)
+    both_nan &= np.isnan(right)
+    return bool(np.array_equal(neq, both_nan))
 
 
 def _array_equivalent_datetimelike(left: np.ndarray, right: np.ndarray) -> bool:
@@ -651,7 +687,11 @@ def remove_na_arraylike(arr: Series | Index | np.ndarray):
     if isinstance(arr.dtype, ExtensionDtype):
         return arr[notna(arr)]
     else:
-        return arr[notna(np.asarray(arr))]
+        # invert the freshly-allocated isna mask in place rather than
+        #  allocating a second boolean array through notna
+        mask = isna(np.asarray(arr))
+        np.logical_not(mask, out=mask)
+        return arr[mask]
 
 
 def is_valid_na_for_dtype(obj, dtype: DtypeObj) -> bool:
@@ -667,7 +707,10 @@ def is_valid_na_for_dtype(obj, dtype: DtypeObj) -> bool:
     -------
     bool
     """
-    if not lib.is_scalar(obj) or not isna(obj):
+    if obj is None or obj is libmissing.NA:
+        # fastpath for the most common sentinels, valid for every dtype
+        return True
+    elif obj is not NaT and (not lib.is_scalar(obj) or not isna(obj)):
         return False
     elif dtype.kind == "M":
         if isinstance(dtype, np.dtype):
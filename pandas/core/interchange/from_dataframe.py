@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import ctypes
 import re
+from types import SimpleNamespace
 from typing import (
     Any,
     overload,
@@ -11,7 +11,10 @@ import numpy as np
 
 from pandas.compat._optional import import_optional_dependency
 
+from pandas.core.dtypes.concat import concat_compat
+
 import pandas as pd
+from pandas.core.construction import extract_array
 from pandas.core.interchange.dataframe_protocol import (
     Buffer,
     Column,
@@ -24,13 +27,25 @@ from pandas.core.interchange.utils import (
     Endianness,
 )
 
-_NP_DTYPES: dict[DtypeKind, dict[int, Any]] = {
-    DtypeKind.INT: {8: np.int8, 16: np.int16, 32: np.int32, 64: np.int64},
-    DtypeKind.UINT: {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64},
-    DtypeKind.FLOAT: {32: np.float32, 64: np.float64},
-    DtypeKind.BOOL: {1: bool, 8: bool},
+# NumPy dtypes keyed by (kind, bit width), so a single lookup is needed per buffer
+_NP_DTYPES: dict[tuple[DtypeKind, int], np.dtype] = {
+    (kind, bit_width): np.dtype(np_type)
+    for kind, np_types in {
+        DtypeKind.INT: {8: np.int8, 16: np.int16, 32: np.int32, 64: np.int64},
+        DtypeKind.UINT: {8: np.uint8, 16: np.uint16, 32: np.uint32, 64: np.uint64},
+        DtypeKind.FLOAT: {32: np.float32, 64: np.float64},
+        DtypeKind.BOOL: {1: bool, 8: bool},
+    }.items()
+    for bit_width, np_type in np_types.items()
 }
 
+# Null kinds for which the data doesn't need to be masked with ``set_nulls``
+_NO_MASK_NULL_KINDS = (ColumnNullType.NON_NULLABLE, ColumnNullType.USE_NAN)
+
+# Datetime format strings: timestamp 'ts{unit}:tz' and date 'td{Days/Ms}'
+_TIMESTAMP_FORMAT_RE = re.compile(r"ts([smun]):(.*)")
+_DATE_FORMAT_RE = re.compile(r"td([Dm])")
+
 
 def from_dataframe(df, allow_copy: bool = True) -> pd.DataFrame:
     """
@@ -105,21 +120,39 @@ def _from_dataframe(df: DataFrameXchg, allow_copy: bool = True) -> pd.DataFrame:
     -------
     pd.DataFrame
     """
-    pandas_dfs = []
+    chunks_columns = []
+    chunks_buffers = []  # hold on to buffers, keeps memory alive
     for chunk in df.get_chunks():
-        pandas_df = protocol_df_chunk_to_pandas(chunk)
-        pandas_dfs.append(pandas_df)
+        columns, buffers = _protocol_df_chunk_to_columns(chunk)
+        chunks_columns.append(columns)
+        chunks_buffers.append(buffers)
 
-    if not allow_copy and len(pandas_dfs) > 1:
+    if not allow_copy and len(chunks_columns) > 1:
         raise RuntimeError(
             "To join chunks a copy is required which is forbidden by allow_copy=False"
         )
-    if not pandas_dfs:
+    if not chunks_columns:
         pandas_df = protocol_df_chunk_to_pandas(df)
-    elif len(pandas_dfs) == 1:
-        pandas_df = pandas_dfs[0]
+    elif len(chunks_columns) == 1:
+        pandas_df = _columns_to_pandas(chunks_columns[0], chunks_buffers[0])
     else:
-        pandas_df = pd.concat(pandas_dfs, axis=0, ignore_index=True, copy=False)
+        # Join every column across the chunks once instead of building a
+        #  DataFrame per chunk and concatenating those
+        names = list(chunks_columns[0])
+        arrays = [
+            concat_compat(
+                [
+                    extract_array(columns[name], extract_numpy=True)
+                    for columns in chunks_columns
+                ]
+            )
+            for name in names
+        ]
+        pandas_df = pd.DataFrame._from_arrays(
+            arrays,
+            columns=pd.Index(names) if names else pd.RangeIndex(0),
+            index=None,
+        )
 
     index_obj = df.metadata.get("pandas.index", None)
     if index_obj is not None:
@@ -140,6 +173,26 @@ def protocol_df_chunk_to_pandas(df: DataFrameXchg) -> pd.DataFrame:
     -------
     pd.DataFrame
     """
+    columns, buffers = _protocol_df_chunk_to_columns(df)
+    return _columns_to_pandas(columns, buffers)
+
+
+def _protocol_df_chunk_to_columns(
+    df: DataFrameXchg,
+) -> tuple[dict[str, Any], list[Any]]:
+    """
+    Convert the columns of an interchange protocol chunk to arrays.
+
+    Parameters
+    ----------
+    df : DataFrameXchg
+
+    Returns
+    -------
+    tuple
+        Tuple of a dict mapping column names to the converted columns and a list
+        of the memory owner objects that keep the memory alive.
+    """
     # We need a dict of columns here, with each column being a NumPy array (at
     # least for now, deal with non-NumPy dtypes later).
     columns: dict[str, Any] = {}
@@ -169,7 +222,20 @@ def protocol_df_chunk_to_pandas(df: DataFrameXchg) -> pd.DataFrame:
 
         buffers.append(buf)
 
-    pandas_df = pd.DataFrame(columns)
+    return columns, buffers
+
+
+def _columns_to_pandas(columns: dict[str, Any], buffers: list[Any]) -> pd.DataFrame:
+    """
+    Build a ``pd.DataFrame`` from the converted columns of a single chunk.
+    """
+    # Build the frame from the arrays directly, skipping the dict handling
+    #  of the DataFrame constructor
+    pandas_df = pd.DataFrame._from_arrays(
+        list(columns.values()),
+        columns=pd.Index(list(columns)) if columns else pd.RangeIndex(0),
+        index=None,
+    )
     pandas_df.attrs["_INTERCHANGE_PROTOCOL_BUFFERS"] = buffers
     return pandas_df
 
@@ -191,13 +257,17 @@ def primitive_column_to_ndarray(col: Column) -> tuple[np.ndarray, Any]:
         that keeps the memory alive.
     """
     buffers = col.get_buffers()
+    describe_null = col.describe_null
 
     data_buff, data_dtype = buffers["data"]
     data = buffer_to_ndarray(
         data_buff, data_dtype, offset=col.offset, length=col.size()
     )
 
-    data = set_nulls(data, col, buffers["validity"])
+    if describe_null[0] not in _NO_MASK_NULL_KINDS:
+        data = set_nulls(
+            data, col, buffers["validity"], describe_null=describe_null
+        )
     return data, buffers
 
 
@@ -231,25 +301,33 @@ def categorical_column_to_series(col: Column) -> tuple[pd.Series, Any]:
             "fallback of using the `col._col` attribute (a ndarray) failed."
         )
     buffers = col.get_buffers()
+    describe_null = col.describe_null
 
     codes_buff, codes_dtype = buffers["data"]
     codes = buffer_to_ndarray(
         codes_buff, codes_dtype, offset=col.offset, length=col.size()
     )
 
-    # Doing module in order to not get ``IndexError`` for
-    # out-of-bounds sentinel values in `codes`
-    if len(categories) > 0:
-        values = categories[codes % len(categories)]
-    else:
-        values = codes
-
-    cat = pd.Categorical(
-        values, categories=categories, ordered=categorical["is_ordered"]
+    # Codes outside of the categories, e.g. sentinel values, are marked as
+    # missing, so the codes can be used as is without materializing the values.
+    # The codes are made signed first so that the -1 marker cannot wrap around
+    # for unsigned code dtypes. This also copies the codes out of the buffer.
+    codes = codes.astype(np.intp, copy=False)
+    codes = np.where((codes >= 0) & (codes < len(categories)), codes, -1)
+
+    cat = pd.Categorical.from_codes(
+        codes,
+        categories=categories,
+        ordered=categorical["is_ordered"],
+        validate=False,
     )
     data = pd.Series(cat)
 
-    data = set_nulls(data, col, buffers["validity"])
+    if describe_null[0] != ColumnNullType.USE_SENTINEL:
+        # sentinel values were already handled through the codes
+        data = set_nulls(
+            data, col, buffers["validity"], describe_null=describe_null
+        )
     return data, buffers
 
 
@@ -279,6 +357,8 @@ def string_column_to_ndarray(col: Column) -> tuple[np.ndarray, Any]:
         )
 
     buffers = col.get_buffers()
+    size = col.size()
+    offset = col.offset
 
     assert buffers["offsets"], "String buffers must contain offsets"
     # Retrieve the data buffer containing the UTF-8 code units
@@ -303,51 +383,68 @@ def string_column_to_ndarray(col: Column) -> tuple[np.ndarray, Any]:
     # the beginning and the ending of each string
     offset_buff, offset_dtype = buffers["offsets"]
     # Offsets buffer contains start-stop positions of strings in the data buffer,
-    # meaning that it has more elements than in the data buffer, do `col.size() + 1`
+    # meaning that it has more elements than in the data buffer, do `size + 1`
     # here to pass a proper offsets buffer size
     offsets = buffer_to_ndarray(
-        offset_buff, offset_dtype, offset=col.offset, length=col.size() + 1
+        offset_buff, offset_dtype, offset=offset, length=size + 1
     )
 
     null_pos = None
     if null_kind in (ColumnNullType.USE_BITMASK, ColumnNullType.USE_BYTEMASK):
         validity = buffers["validity"]
         if validity is not None:
-            valid_buff, valid_dtype = validity
-            null_pos = buffer_to_ndarray(
-                valid_buff, valid_dtype, offset=col.offset, length=col.size()
+            null_pos = validity_to_null_pos(
+                validity, sentinel_val, offset=offset, length=size
             )
-            if sentinel_val == 0:
-                null_pos = ~null_pos
 
-    # Assemble the strings from the code units
-    str_list: list[None | float | str] = [None] * col.size()
-    for i in range(col.size()):
+    pa = import_optional_dependency("pyarrow", errors="ignore")
+    if pa is not None:
+        # Decode all the strings at once rather than one Python call per row.
+        # The offsets are already sliced to this column, so no offset is passed.
+        validity_buff = None
+        if null_pos is not None:
+            validity_buff = pa.py_buffer(np.packbits(~null_pos, bitorder="little"))
+        arrow_type = pa.large_string() if offsets.dtype.itemsize == 8 else pa.string()
+        arr = pa.Array.from_buffers(
+            arrow_type,
+            size,
+            [validity_buff, pa.py_buffer(offsets), pa.py_buffer(data)],
+        )
+        result = arr.to_numpy(zero_copy_only=False)
+        if null_pos is not None:
+            result[null_pos] = np.nan
+        return result, buffers
+
+    # Assemble the strings from the code units directly into an object array
+    result = np.empty(size, dtype=object)
+    # Slicing a memoryview doesn't create a new ndarray per row
+    data_view = memoryview(data)
+    # Python ints are cheaper to index with than NumPy scalars
+    starts = offsets[:-1].tolist()
+    stops = offsets[1:].tolist()
+    is_null = null_pos.tolist() if null_pos is not None else None
+    for i, (start, stop) in enumerate(zip(starts, stops)):
         # Check for missing values
-        if null_pos is not None and null_pos[i]:
-            str_list[i] = np.nan
+        if is_null is not None and is_null[i]:
+            result[i] = np.nan
             continue
 
         # Extract a range of code units
-        units = data[offsets[i] : offsets[i + 1]]
-
-        # Convert the list of code units to bytes
-        str_bytes = bytes(units)
+        units = data_view[start:stop]
 
-        # Create the string
-        string = str_bytes.decode(encoding="utf-8")
+        # Create the string, decoding straight from the buffer
+        string = str(units, encoding="utf-8")
 
-        # Add to our list of strings
-        str_list[i] = string
+        # Add to our array of strings
+        result[i] = string
 
-    # Convert the string list to a NumPy array
-    return np.asarray(str_list, dtype="object"), buffers
+    return result, buffers
 
 
 def parse_datetime_format_str(format_str, data) -> pd.Series | np.ndarray:
     """Parse datetime `format_str` to interpret the `data`."""
     # timestamp 'ts{unit}:tz'
-    timestamp_meta = re.match(r"ts([smun]):(.*)", format_str)
+    timestamp_meta = _TIMESTAMP_FORMAT_RE.match(format_str)
     if timestamp_meta:
         unit, tz = timestamp_meta.group(1), timestamp_meta.group(2)
         if unit != "s":
@@ -361,13 +458,16 @@ def parse_datetime_format_str(format_str, data) -> pd.Series | np.ndarray:
         return data
 
     # date 'td{Days/Ms}'
-    date_meta = re.match(r"td([Dm])", format_str)
+    date_meta = _DATE_FORMAT_RE.match(format_str)
     if date_meta:
         unit = date_meta.group(1)
         if unit == "D":
             # NumPy doesn't support DAY unit, so converting days to seconds
-            # (converting to uint64 to avoid overflow)
-            data = (data.astype(np.uint64) * (24 * 60 * 60)).astype("datetime64[s]")
+            # (computing in int64 to avoid overflow) and viewing the result
+            # as datetime64 without a second copy
+            seconds = np.empty(data.shape, dtype=np.int64)
+            np.multiply(data, 24 * 60 * 60, out=seconds, dtype=np.int64)
+            data = seconds.view("datetime64[s]")
         elif unit == "m":
             data = data.astype("datetime64[ms]")
         else:
@@ -392,6 +492,7 @@ def datetime_column_to_ndarray(col: Column) -> tuple[np.ndarray | pd.Series, Any
         that keeps the memory alive.
     """
     buffers = col.get_buffers()
+    describe_null = col.describe_null
 
     _, col_bit_width, format_str, _ = col.dtype
     dbuf, _ = buffers["data"]
@@ -410,7 +511,10 @@ def datetime_column_to_ndarray(col: Column) -> tuple[np.ndarray | pd.Series, Any
     )
 
     data = parse_datetime_format_str(format_str, data)  # type: ignore[assignment]
-    data = set_nulls(data, col, buffers["validity"])
+    if describe_null[0] not in _NO_MASK_NULL_KINDS:
+        data = set_nulls(
+            data, col, buffers["validity"], describe_null=describe_null
+        )
     return data, buffers
 
 
@@ -448,32 +552,110 @@ def buffer_to_ndarray(
     """
     kind, bit_width, _, _ = dtype
 
-    column_dtype = _NP_DTYPES.get(kind, {}).get(bit_width, None)
+    column_dtype = _NP_DTYPES.get((kind, bit_width))
     if column_dtype is None:
         raise NotImplementedError(f"Conversion for {dtype} is not yet supported.")
 
     # TODO: No DLPack yet, so need to construct a new ndarray from the data pointer
     # and size in the buffer plus the dtype on the column. Use DLPack as NumPy supports
     # it since https://github.com/numpy/numpy/pull/19083
-    ctypes_type = np.ctypeslib.as_ctypes_type(column_dtype)
-
     if bit_width == 1:
         assert length is not None, "`length` must be specified for a bit-mask buffer."
-        pa = import_optional_dependency("pyarrow")
-        arr = pa.BooleanArray.from_buffers(
-            pa.bool_(),
-            length,
-            [None, pa.foreign_buffer(buffer.ptr, length)],
-            offset=offset,
-        )
-        return np.asarray(arr)
+        return bitmask_to_bool_ndarray(buffer, length=length, offset=offset)
     else:
-        data_pointer = ctypes.cast(
-            buffer.ptr + (offset * bit_width // 8), ctypes.POINTER(ctypes_type)
-        )
         if length > 0:
-            return np.ctypeslib.as_array(data_pointer, shape=(length,))
-        return np.array([], dtype=ctypes_type)
+            return _pointer_to_ndarray(
+                buffer.ptr + (offset * bit_width // 8), length, column_dtype
+            )
+        return np.array([], dtype=column_dtype)
+
+
+def _pointer_to_ndarray(ptr: int, length: int, dtype: np.dtype) -> np.ndarray:
+    """
+    View ``length`` elements of ``dtype`` starting at ``ptr`` as a NumPy array.
+
+    The memory is exposed through the array interface, which avoids building
+    ctypes pointer and array types for every buffer.
+    """
+    interface = {
+        "data": (ptr, False),
+        "shape": (length,),
+        "typestr": dtype.str,
+        "version": 3,
+    }
+    return np.asarray(SimpleNamespace(__array_interface__=interface))
+
+
+def bitmask_to_bool_ndarray(
+    buffer: Buffer, *, length: int, offset: int = 0
+) -> np.ndarray:
+    """
+    Convert a bit-mask buffer to a boolean NumPy array.
+
+    Parameters
+    ----------
+    buffer : Buffer
+        Buffer holding the bit-mask, least significant bit first.
+    length : int
+        Number of bits to read from the buffer.
+    offset : int, default: 0
+        Number of bits to skip from the start of the buffer.
+
+    Returns
+    -------
+    np.ndarray[bool]
+    """
+    if length == 0:
+        return np.array([], dtype=bool)
+
+    # Only read the bytes covering the requested bits
+    first_byte_offset, bit_offset = divmod(offset, 8)
+    nbits = bit_offset + length
+    bitmask = _pointer_to_ndarray(
+        buffer.ptr + first_byte_offset, (nbits + 7) // 8, np.dtype(np.uint8)
+    )
+
+    # unpackbits yields a new array of 0/1 bytes, so viewing it as bool is safe
+    bool_mask = np.unpackbits(bitmask, count=nbits, bitorder="little").view(bool)
+    return bool_mask[bit_offset:]
+
+
+def validity_to_null_pos(
+    validity: tuple[Buffer, tuple[DtypeKind, int, str, str]],
+    sentinel_val: int,
+    *,
+    length: int,
+    offset: int = 0,
+) -> np.ndarray:
+    """
+    Decode a validity bit-mask or byte-mask into a boolean array of null positions.
+
+    Parameters
+    ----------
+    validity : tuple(Buffer, dtype)
+        The validity buffer of the column and its dtype.
+    sentinel_val : int
+        The mask value denoting a null, as given by ``col.describe_null``.
+    length : int
+        Number of elements in the column.
+    offset : int, default: 0
+        Number of elements to offset from the start of the buffer.
+
+    Returns
+    -------
+    np.ndarray[bool]
+        True where the column holds a null.
+    """
+    valid_buff, valid_dtype = validity
+    null_pos = buffer_to_ndarray(valid_buff, valid_dtype, offset=offset, length=length)
+    if sentinel_val == 0:
+        if valid_dtype[1] == 1:
+            # a decoded bit-mask is a new array, so invert it in place
+            np.logical_not(null_pos, out=null_pos)
+        else:
+            # a byte-mask is a view on the producer's memory
+            null_pos = ~null_pos
+    return null_pos
 
 
 @overload
@@ -482,6 +664,8 @@ def set_nulls(
     col: Column,
     validity: tuple[Buffer, tuple[DtypeKind, int, str, str]] | None,
     allow_modify_inplace: bool = ...,
+    *,
+    describe_null: tuple[ColumnNullType, Any] | None = ...,
 ) -> np.ndarray: ...
 
 
@@ -491,6 +675,8 @@ def set_nulls(
     col: Column,
     validity: tuple[Buffer, tuple[DtypeKind, int, str, str]] | None,
     allow_modify_inplace: bool = ...,
+    *,
+    describe_null: tuple[ColumnNullType, Any] | None = ...,
 ) -> pd.Series: ...
 
 
@@ -500,6 +686,8 @@ def set_nulls(
     col: Column,
     validity: tuple[Buffer, tuple[DtypeKind, int, str, str]] | None,
     allow_modify_inplace: bool = ...,
+    *,
+    describe_null: tuple[ColumnNullType, Any] | None = ...,
 ) -> np.ndarray | pd.Series: ...
 
 
@@ -508,6 +696,8 @@ def set_nulls(
     col: Column,
     validity: tuple[Buffer, tuple[DtypeKind, int, str, str]] | None,
     allow_modify_inplace: bool = True,
+    *,
+    describe_null: tuple[ColumnNullType, Any] | None = None,
 ) -> np.ndarray | pd.Series:
     """
     Set null values for the data according to the column null kind.
@@ -524,6 +714,9 @@ def set_nulls(
     allow_modify_inplace : bool, default: True
         Whether to modify the `data` inplace when zero-copy is possible (True) or always
         modify a copy of the `data` (False).
+    describe_null : tuple(ColumnNullType, Any), optional
+        The value of ``col.describe_null`` if the caller already has it, so it
+        is not requested from the column again.
 
     Returns
     -------
@@ -532,34 +725,34 @@ def set_nulls(
     """
     if validity is None:
         return data
-    null_kind, sentinel_val = col.describe_null
+    if describe_null is None:
+        describe_null = col.describe_null
+    null_kind, sentinel_val = describe_null
     null_pos = None
 
     if null_kind == ColumnNullType.USE_SENTINEL:
-        null_pos = pd.Series(data) == sentinel_val
+        if isinstance(data, np.ndarray) and data.dtype.kind in "biuf":
+            # compare numeric arrays directly instead of boxing in a Series
+            null_pos = data == sentinel_val
+        else:
+            null_pos = pd.Series(data) == sentinel_val
     elif null_kind in (ColumnNullType.USE_BITMASK, ColumnNullType.USE_BYTEMASK):
         assert validity, "Expected to have a validity buffer for the mask"
-        valid_buff, valid_dtype = validity
-        null_pos = buffer_to_ndarray(
-            valid_buff, valid_dtype, offset=col.offset, length=col.size()
+        null_pos = validity_to_null_pos(
+            validity, sentinel_val, offset=col.offset, length=col.size()
         )
-        if sentinel_val == 0:
-            null_pos = ~null_pos
-    elif null_kind in (ColumnNullType.NON_NULLABLE, ColumnNullType.USE_NAN):
+    elif null_kind in _NO_MASK_NULL_KINDS:
         pass
     else:
         raise NotImplementedError(f"Null kind {null_kind} is not yet supported.")
 
     if null_pos is not None and np.any(null_pos):
-        if not allow_modify_inplace:
-            data = data.copy()
-        try:
-            data[null_pos] = None
-        except TypeError:
-            # TypeError happens if the `data` dtype appears to be non-nullable
-            # in numpy notation (bool, int, uint). If this happens,
-            # cast the `data` to nullable float dtype.
+        if data.dtype.kind in "iu":
+            # The `data` dtype is non-nullable in numpy notation (int, uint),
+            # so cast it to nullable float dtype. This always copies.
             data = data.astype(float)
-            data[null_pos] = None
+        elif not allow_modify_inplace:
+            data = data.copy()
+        data[null_pos] = None
 
     return data
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import types
 from typing import TYPE_CHECKING
@@ -70,11 +71,15 @@ def get_jit_arguments(
     return {"nopython": nopython, "nogil": nogil, "parallel": parallel}
 
 
+@functools.cache
 def jit_user_function(func: Callable) -> Callable:
     """
     If user function is not jitted already, mark the user's function
     as jitable.
 
+    The result is cached per function, so a function used by several numba
+    routines is only registered once.
+
     Parameters
     ----------
     func : function
@@ -25,6 +25,8 @@ from typing import (
 import warnings
 import zipfile
 
+import numpy as np
+
 from pandas._config import config
 
 from pandas._libs import lib
@@ -740,6 +742,9 @@ class BaseExcelReader(Generic[_WorkbookT]):
 
         output = {}
 
+        usecols = maybe_convert_usecols(usecols)
+        file_rows_needed = self._calc_rows(header, index_col, skiprows, nrows)
+
         last_sheetname = None
         for asheetname in sheets:
             last_sheetname = asheetname
@@ -751,12 +756,10 @@ class BaseExcelReader(Generic[_WorkbookT]):
             else:  # assume an integer if not a string
                 sheet = self.get_sheet_by_index(asheetname)
 
-            file_rows_needed = self._calc_rows(header, index_col, skiprows, nrows)
             data = self.get_sheet_data(sheet, file_rows_needed)
             if hasattr(sheet, "close"):
                 # pyxlsb opens two TemporaryFiles
                 sheet.close()
-            usecols = maybe_convert_usecols(usecols)
 
             if not data:
                 output[asheetname] = DataFrame()
@@ -949,6 +952,27 @@ class BaseExcelReader(Generic[_WorkbookT]):
         return output
 
 
+# Exact types that ExcelWriter._value_with_fmt converts to a plain Python
+# scalar with no number format; anything else goes through the isinstance checks
+_SCALAR_CONVERTERS: dict[type, type] = {
+    int: int,
+    float: float,
+    bool: bool,
+    np.int8: int,
+    np.int16: int,
+    np.int32: int,
+    np.int64: int,
+    np.uint8: int,
+    np.uint16: int,
+    np.uint32: int,
+    np.uint64: int,
+    np.float16: float,
+    np.float32: float,
+    np.float64: float,
+    np.bool_: bool,
+}
+
+
 @doc(storage_options=_shared_docs["storage_options"])
 class ExcelWriter(Generic[_WorkbookT]):
     """
@@ -1340,6 +1364,10 @@ class ExcelWriter(Generic[_WorkbookT]):
         Tuple with the first element being the converted value and the second
             being an optional format
         """
+        converter = _SCALAR_CONVERTERS.get(type(val))
+        if converter is not None:
+            return converter(val), None
+
         fmt = None
 
         if is_integer(val):
@@ -89,6 +89,9 @@ class OpenpyxlWriter(ExcelWriter):
             if self.book.worksheets:
                 self.book.remove(self.book.worksheets[0])
 
+        # Converted styles are reused by every sheet written to this workbook.
+        self._style_cache: dict[str, dict[str, Serialisable]] = {}
+
     @property
     def book(self) -> Workbook:
         """
@@ -451,7 +454,7 @@ class OpenpyxlWriter(ExcelWriter):
         # Write the frame cells using openpyxl.
         sheet_name = self._get_sheet_name(sheet_name)
 
-        _style_cache: dict[str, dict[str, Serialisable]] = {}
+        _style_cache = self._style_cache
 
         if sheet_name in self.sheets and self._if_sheet_exists != "new":
             if "r+" in self._mode:
@@ -587,34 +590,37 @@ class OpenpyxlReader(BaseExcelReader["Workbook"]):
         self.raise_if_bad_sheet_by_index(index)
         return self.book.worksheets[index]
 
-    def _convert_cell(self, cell) -> Scalar:
+    def get_sheet_data(
+        self, sheet, file_rows_needed: int | None = None
+    ) -> list[list[Scalar]]:
+        # Resolve the cell type constants once per sheet, not once per cell.
         from openpyxl.cell.cell import (
             TYPE_ERROR,
             TYPE_NUMERIC,
         )
 
-        if cell.value is None:
-            return ""  # compat with xlrd
-        elif cell.data_type == TYPE_ERROR:
-            return np.nan
-        elif cell.data_type == TYPE_NUMERIC:
-            val = int(cell.value)
-            if val == cell.value:
-                return val
-            return float(cell.value)
+        def _convert_cell(cell) -> Scalar:
+            value = cell.value
+            if value is None:
+                return ""  # compat with xlrd
+            data_type = cell.data_type
+            if data_type == TYPE_ERROR:
+                return np.nan
+            elif data_type == TYPE_NUMERIC:
+                val = int(value)
+                if val == value:
+                    return val
+                return float(value)
+
+            return value
 
-        return cell.value
-
-    def get_sheet_data(
-        self, sheet, file_rows_needed: int | None = None
-    ) -> list[list[Scalar]]:
         if self.book.read_only:
             sheet.reset_dimensions()
 
         data: list[list[Scalar]] = []
         last_row_with_data = -1
         for row_number, row in enumerate(sheet.rows):
-            converted_row = [self._convert_cell(cell) for cell in row]
+            converted_row = [_convert_cell(cell) for cell in row]
             while converted_row and converted_row[-1] == "":
                 # trim trailing empty elements
                 converted_row.pop()
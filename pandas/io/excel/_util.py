@@ -117,12 +117,13 @@ def _excel2num(x: str) -> int:
     index = 0
 
     for c in x.upper().strip():
-        cp = ord(c)
+        # "A" maps to 1, "Z" to 26
+        digit = ord(c) - 64
 
-        if cp < ord("A") or cp > ord("Z"):
+        if not 1 <= digit <= 26:
             raise ValueError(f"Invalid column name: {x}")
 
-        index = index * 26 + cp - ord("A") + 1
+        index = index * 26 + digit
 
     return index - 1
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import time
+import io
 import math
+import mmap
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -59,8 +61,25 @@ class XlrdReader(BaseExcelReader["Book"]):
         from xlrd import open_workbook
 
         if hasattr(filepath_or_buffer, "read"):
-            data = filepath_or_buffer.read()
-            return open_workbook(file_contents=data, **engine_kwargs)
+            data: bytes | mmap.mmap
+            if isinstance(filepath_or_buffer, (io.BufferedReader, io.FileIO)):
+                # Map local files instead of copying them into memory; xlrd
+                # closes the map once it has finished loading the workbook.
+                try:
+                    data = mmap.mmap(
+                        filepath_or_buffer.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                except (OSError, ValueError):
+                    # no usable file descriptor, or an empty file
+                    data = filepath_or_buffer.read()
+            else:
+                data = filepath_or_buffer.read()
+            try:
+                return open_workbook(file_contents=data, **engine_kwargs)
+            except Exception:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+                raise
         else:
             return open_workbook(filepath_or_buffer, **engine_kwargs)
 
@@ -80,10 +99,13 @@ class XlrdReader(BaseExcelReader["Book"]):
         self, sheet, file_rows_needed: int | None = None
     ) -> list[list[Scalar]]:
         from xlrd import (
+            XL_CELL_BLANK,
             XL_CELL_BOOLEAN,
             XL_CELL_DATE,
+            XL_CELL_EMPTY,
             XL_CELL_ERROR,
             XL_CELL_NUMBER,
+            XL_CELL_TEXT,
             xldate,
         )
 
@@ -128,12 +150,15 @@ class XlrdReader(BaseExcelReader["Book"]):
                         cell_contents = val
             return cell_contents
 
+        # _parse_cell returns these unchanged, so don't call it for them
+        unconverted_types = frozenset((XL_CELL_TEXT, XL_CELL_EMPTY, XL_CELL_BLANK))
+
         nrows = sheet.nrows
         if file_rows_needed is not None:
             nrows = min(nrows, file_rows_needed)
         return [
             [
-                _parse_cell(value, typ)
+                value if typ in unconverted_types else _parse_cell(value, typ)
                 for value, typ in zip(sheet.row_values(i), sheet.row_types(i))
             ]
             for i in range(nrows)
@@ -218,6 +218,15 @@ class XlsxWriter(ExcelWriter):
             self._handles.handle.close()
             raise
 
+        # Formats belong to the workbook, so they are cached for the lifetime
+        # of the writer and shared by every sheet written to it.
+        # ExcelFormatter hands out the same style dict object for cells that
+        # share a style, so formats are looked up by identity before falling
+        # back to serializing the style. Each entry keeps its style alive, so
+        # an id in this cache cannot be reused by another object.
+        self._style_dict: dict[str, Any] = {"null": None}
+        self._style_by_id: dict[tuple[int, str | None], tuple[Any, Any]] = {}
+
     @property
     def book(self):
         """
@@ -253,7 +262,8 @@ class XlsxWriter(ExcelWriter):
         if wks is None:
             wks = self.book.add_worksheet(sheet_name)
 
-        style_dict = {"null": None}
+        style_dict = self._style_dict
+        style_by_id = self._style_by_id
 
         if validate_freeze_panes(freeze_panes):
             wks.freeze_panes(*(freeze_panes))
@@ -261,15 +271,26 @@ class XlsxWriter(ExcelWriter):
         for cell in cells:
             val, fmt = self._value_with_fmt(cell.val)
 
-            stylekey = json.dumps(cell.style)
-            if fmt:
-                stylekey += fmt
-
-            if stylekey in style_dict:
-                style = style_dict[stylekey]
+            if cell.style is None and not fmt:
+                # Most cells are unstyled; they are written with no format
+                style = None
             else:
-                style = self.book.add_format(_XlsxStyler.convert(cell.style, fmt))
-                style_dict[stylekey] = style
+                id_key = (id(cell.style), fmt)
+                if id_key in style_by_id:
+                    style = style_by_id[id_key][1]
+                else:
+                    stylekey = json.dumps(cell.style)
+                    if fmt:
+                        stylekey += fmt
+
+                    if stylekey in style_dict:
+                        style = style_dict[stylekey]
+                    else:
+                        style = self.book.add_format(
+                            _XlsxStyler.convert(cell.style, fmt)
+                        )
+                        style_dict[stylekey] = style
+                    style_by_id[id_key] = (cell.style, style)
 
             if cell.mergestart is not None and cell.mergeend is not None:
                 wks.merge_range(
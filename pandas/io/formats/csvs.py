@@ -30,7 +30,6 @@ from pandas.core.dtypes.generic import (
     ABCMultiIndex,
     ABCPeriodIndex,
 )
-from pandas.core.dtypes.missing import notna
 
 from pandas.core.indexes.api import Index
 
@@ -146,7 +145,7 @@ class CSVFormatter:
             return quotechar
         return None
 
-    @property
+    @cache_readonly
     def has_mi_columns(self) -> bool:
         return bool(isinstance(self.obj.columns, ABCMultiIndex))
 
@@ -176,7 +175,7 @@ class CSVFormatter:
             return (_DEFAULT_CHUNKSIZE_CELLS // (len(self.cols) or 1)) or 1
         return int(chunksize)
 
-    @property
+    @cache_readonly
     def _number_format(self) -> dict[str, Any]:
         """Dictionary used for storing number formatting settings."""
         return {
@@ -195,28 +194,28 @@ class CSVFormatter:
             and self.date_format is not None
         ):
             data_index = Index(
-                [x.strftime(self.date_format) if notna(x) else "" for x in data_index]
+                data_index._get_values_for_csv(date_format=self.date_format, na_rep="")
             )
         elif isinstance(data_index, ABCMultiIndex):
             data_index = data_index.remove_unused_levels()
         return data_index
 
-    @property
+    @cache_readonly
     def nlevels(self) -> int:
         if self.index:
             return getattr(self.data_index, "nlevels", 1)
         else:
             return 0
 
-    @property
+    @cache_readonly
     def _has_aliases(self) -> bool:
         return isinstance(self.header, (tuple, list, np.ndarray, ABCIndex))
 
-    @property
+    @cache_readonly
     def _need_to_save_header(self) -> bool:
         return bool(self._has_aliases or self.header)
 
-    @property
+    @cache_readonly
     def write_cols(self) -> SequenceNotStr[Hashable]:
         if self._has_aliases:
             assert not isinstance(self.header, bool)
@@ -230,7 +229,7 @@ class CSVFormatter:
             #  so its entries are strings, i.e. hashable
             return cast(SequenceNotStr[Hashable], self.cols)
 
-    @property
+    @cache_readonly
     def encoded_labels(self) -> list[Hashable]:
         encoded_labels: list[Hashable] = []
 
@@ -314,13 +313,23 @@ class CSVFormatter:
 
     def _save_chunk(self, start_i: int, end_i: int) -> None:
         # create the data for a chunk
-        slicer = slice(start_i, end_i)
-        df = self.obj.iloc[slicer]
+        if start_i == 0 and end_i == len(self.obj):
+            # the chunk covers the whole frame, so there is nothing to slice
+            df = self.obj
+            data_index = self.data_index
+        else:
+            slicer = slice(start_i, end_i)
+            df = self.obj.iloc[slicer]
+            data_index = self.data_index[slicer]
 
         res = df._get_values_for_csv(**self._number_format)
         data = list(res._iter_column_arrays())
 
-        ix = self.data_index[slicer]._get_values_for_csv(**self._number_format)
+        if self.index:
+            ix = data_index._get_values_for_csv(**self._number_format)
+        else:
+            # the index is not written; write_csv_rows only uses its length
+            ix = np.empty(end_i - start_i, dtype=object)
         libwriters.write_csv_rows(
             data,
             ix,
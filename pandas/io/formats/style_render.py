@@ -941,8 +941,9 @@ class StylerRenderer:
             data_len = len(row_body_cells) if "data" in clines and d["body"] else 0
 
             d["clines"] = defaultdict(list)
+            hidden_rows = set(self.hidden_rows)
             visible_row_indexes: list[int] = [
-                r for r in range(len(self.data.index)) if r not in self.hidden_rows
+                r for r in range(len(self.data.index)) if r not in hidden_rows
             ]
             visible_index_levels: list[int] = [
                 i for i in range(index_levels) if not self.hide_index_[i]
@@ -1811,13 +1812,13 @@ def _get_level_lengths(
     else:
         levels = index._format_flat(include_name=False)
 
-    if hidden_elements is None:
-        hidden_elements = []
+    # set for O(1) membership checks against every element of every level
+    hidden: set[int] = set() if hidden_elements is None else set(hidden_elements)
 
     lengths = {}
     if not isinstance(index, MultiIndex):
         for i, value in enumerate(levels):
-            if i not in hidden_elements:
+            if i not in hidden:
                 lengths[(0, i)] = 1
         return lengths
 
@@ -1828,10 +1829,10 @@ def _get_level_lengths(
                 break
             if not sparsify:
                 # then lengths will always equal 1 since no aggregation.
-                if j not in hidden_elements:
+                if j not in hidden:
                     lengths[(i, j)] = 1
                     visible_row_count += 1
-            elif (row is not lib.no_default) and (j not in hidden_elements):
+            elif (row is not lib.no_default) and (j not in hidden):
                 # this element has not been sparsified so must be the start of section
                 last_label = j
                 lengths[(i, last_label)] = 1
@@ -1841,7 +1842,7 @@ def _get_level_lengths(
                 # later elements are visible
                 last_label = j
                 lengths[(i, last_label)] = 0
-            elif j not in hidden_elements:
+            elif j not in hidden:
                 # then element must be part of sparsified section and is visible
                 visible_row_count += 1
                 if visible_row_count > max_index:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import itertools
+
 import pytest
 
 import pandas as pd
@@ -20,20 +22,27 @@ class Base:
         # ignored ones
         # compare vs the expected
 
-        result = sorted(
+        # dir() rather than vars() so that names advertised through a
+        # module-level __dir__ (e.g. the lazy attributes of pandas.util)
+        # are included
+        result = {
             f for f in dir(namespace) if not f.startswith("__") and f != "annotations"
-        )
+        }
         if ignored is not None:
-            result = sorted(set(result) - set(ignored))
+            result.difference_update(ignored)
+
+        expected = frozenset(expected)
+        extraneous = result - expected
+        assert not extraneous, f"unexpected names: {sorted(extraneous)}"
 
-        expected = sorted(expected)
-        tm.assert_almost_equal(result, expected)
+        missing = expected - result
+        assert not missing, f"missing names: {sorted(missing)}"
 
 
 class TestPDApi(Base):
     # these are optionally imported based on testing
     # & need to be ignored
-    ignored = ["tests", "locale", "conftest", "_version_meson"]
+    ignored = frozenset(["tests", "locale", "conftest", "_version_meson"])
 
     # top-level sub-packages
     public_lib = [
@@ -194,34 +203,38 @@ class TestPDApi(Base):
     if not pd._built_with_meson:
         private_modules.append("_version")
 
+    # every name expected in the top-level namespace, built once
+    expected = frozenset(
+        public_lib
+        + private_lib
+        + misc
+        + modules
+        + classes
+        + funcs
+        + funcs_option
+        + funcs_read
+        + funcs_json
+        + funcs_to
+        + private_modules
+    )
+
     def test_api(self):
-        checkthese = (
-            self.public_lib
-            + self.private_lib
-            + self.misc
-            + self.modules
-            + self.classes
-            + self.funcs
-            + self.funcs_option
-            + self.funcs_read
-            + self.funcs_json
-            + self.funcs_to
-            + self.private_modules
-        )
-        self.check(namespace=pd, expected=checkthese, ignored=self.ignored)
+        self.check(namespace=pd, expected=self.expected, ignored=self.ignored)
 
     def test_api_all(self):
         expected = set(
-            self.public_lib
-            + self.misc
-            + self.modules
-            + self.classes
-            + self.funcs
-            + self.funcs_option
-            + self.funcs_read
-            + self.funcs_json
-            + self.funcs_to
-        ) - set(self.deprecated_classes)
+            itertools.chain(
+                self.public_lib,
+                self.misc,
+                self.modules,
+                self.classes,
+                self.funcs,
+                self.funcs_option,
+                self.funcs_read,
+                self.funcs_json,
+                self.funcs_to,
+            )
+        ).difference(self.deprecated_classes)
         actual = set(pd.__all__)
 
         extraneous = actual - expected
@@ -24,6 +24,15 @@ def mix(request):
     return request.param
 
 
+@pytest.fixture(params=[(None, None), (0, None), (0, 0), (1, 2)])
+def fill_values(request):
+    """
+    Fixture returning the pair of fill_value kwargs for the left and right
+    SparseArray operands
+    """
+    return request.param
+
+
 class TestSparseArrayArithmetics:
     def _assert(self, a, b):
         # We have to use tm.assert_sp_array_equal. See GH #45126
@@ -57,58 +66,39 @@ class TestSparseArrayArithmetics:
         with np.errstate(invalid="ignore"):
             # Unfortunately, trying to wrap the computation of each expected
             # value is with np.errstate() is too tedious.
-            #
-            # sparse & sparse
-            self._check_bool_result(a == b)
-            self._assert((a == b).to_dense(), a_dense == b_dense)
-
-            self._check_bool_result(a != b)
-            self._assert((a != b).to_dense(), a_dense != b_dense)
-
-            self._check_bool_result(a >= b)
-            self._assert((a >= b).to_dense(), a_dense >= b_dense)
-
-            self._check_bool_result(a <= b)
-            self._assert((a <= b).to_dense(), a_dense <= b_dense)
-
-            self._check_bool_result(a > b)
-            self._assert((a > b).to_dense(), a_dense > b_dense)
-
-            self._check_bool_result(a < b)
-            self._assert((a < b).to_dense(), a_dense < b_dense)
-
-            # sparse & dense
-            self._check_bool_result(a == b_dense)
-            self._assert((a == b_dense).to_dense(), a_dense == b_dense)
-
-            self._check_bool_result(a != b_dense)
-            self._assert((a != b_dense).to_dense(), a_dense != b_dense)
-
-            self._check_bool_result(a >= b_dense)
-            self._assert((a >= b_dense).to_dense(), a_dense >= b_dense)
-
-            self._check_bool_result(a <= b_dense)
-            self._assert((a <= b_dense).to_dense(), a_dense <= b_dense)
-
-            self._check_bool_result(a > b_dense)
-            self._assert((a > b_dense).to_dense(), a_dense > b_dense)
-
-            self._check_bool_result(a < b_dense)
-            self._assert((a < b_dense).to_dense(), a_dense < b_dense)
+            for op in [
+                operator.eq,
+                operator.ne,
+                operator.ge,
+                operator.le,
+                operator.gt,
+                operator.lt,
+            ]:
+                expected = op(a_dense, b_dense)
+
+                # sparse & sparse
+                result = op(a, b)
+                self._check_bool_result(result)
+                self._assert(result.to_dense(), expected)
+
+                # sparse & dense
+                result = op(a, b_dense)
+                self._check_bool_result(result)
+                self._assert(result.to_dense(), expected)
 
     def _check_logical_ops(self, a, b, a_dense, b_dense):
-        # sparse & sparse
-        self._check_bool_result(a & b)
-        self._assert((a & b).to_dense(), a_dense & b_dense)
+        for op in [operator.and_, operator.or_]:
+            expected = op(a_dense, b_dense)
 
-        self._check_bool_result(a | b)
-        self._assert((a | b).to_dense(), a_dense | b_dense)
-        # sparse & dense
-        self._check_bool_result(a & b_dense)
-        self._assert((a & b_dense).to_dense(), a_dense & b_dense)
+            # sparse & sparse
+            result = op(a, b)
+            self._check_bool_result(result)
+            self._assert(result.to_dense(), expected)
 
-        self._check_bool_result(a | b_dense)
-        self._assert((a | b_dense).to_dense(), a_dense | b_dense)
+            # sparse & dense
+            result = op(a, b_dense)
+            self._check_bool_result(result)
+            self._assert(result.to_dense(), expected)
 
     @pytest.mark.parametrize("scalar", [0, 1, 3])
     @pytest.mark.parametrize("fill_value", [None, 0, 2])
@@ -120,23 +110,13 @@ class TestSparseArrayArithmetics:
         a = SparseArray(values, kind=kind, fill_value=fill_value)
         self._check_numeric_ops(a, scalar, values, scalar, mix, op)
 
-    def test_float_scalar_comparison(self, kind):
+    @pytest.mark.parametrize("scalar", [0, 1, 3])
+    @pytest.mark.parametrize("fill_value", [None, 0, 2])
+    def test_float_scalar_comparison(self, kind, fill_value, scalar):
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
 
-        a = SparseArray(values, kind=kind)
-        self._check_comparison_ops(a, 1, values, 1)
-        self._check_comparison_ops(a, 0, values, 0)
-        self._check_comparison_ops(a, 3, values, 3)
-
-        a = SparseArray(values, kind=kind, fill_value=0)
-        self._check_comparison_ops(a, 1, values, 1)
-        self._check_comparison_ops(a, 0, values, 0)
-        self._check_comparison_ops(a, 3, values, 3)
-
-        a = SparseArray(values, kind=kind, fill_value=2)
-        self._check_comparison_ops(a, 1, values, 1)
-        self._check_comparison_ops(a, 0, values, 0)
-        self._check_comparison_ops(a, 3, values, 3)
+        a = SparseArray(values, kind=kind, fill_value=fill_value)
+        self._check_comparison_ops(a, scalar, values, scalar)
 
     def test_float_same_index_without_nans(self, kind, mix, all_arithmetic_functions):
         # when sp_index are the same
@@ -177,7 +157,18 @@ class TestSparseArrayArithmetics:
         b = SparseArray(rvalues, kind=kind, fill_value=0)
         self._check_comparison_ops(a, b, values, rvalues)
 
-    def test_float_array(self, kind, mix, all_arithmetic_functions):
+    def test_float_array(self, kind, mix, all_arithmetic_functions, fill_values):
+        a_fill_value, b_fill_value = fill_values
+        op = all_arithmetic_functions
+
+        values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
+        rvalues = np.array([2, np.nan, 2, 3, np.nan, 0, 1, 5, 2, np.nan])
+
+        a = SparseArray(values, kind=kind, fill_value=a_fill_value)
+        b = SparseArray(rvalues, kind=kind, fill_value=b_fill_value)
+        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+
+    def test_float_array_times_zero(self, kind, mix, all_arithmetic_functions):
         op = all_arithmetic_functions
 
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
@@ -185,22 +176,22 @@ class TestSparseArrayArithmetics:
 
         a = SparseArray(values, kind=kind)
         b = SparseArray(rvalues, kind=kind)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
         self._check_numeric_ops(a, b * 0, values, rvalues * 0, mix, op)
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+    def test_float_array_different_kind(
+        self, mix, all_arithmetic_functions, fill_values
+    ):
+        a_fill_value, b_fill_value = fill_values
+        op = all_arithmetic_functions
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind, fill_value=0)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
+        rvalues = np.array([2, np.nan, 2, 3, np.nan, 0, 1, 5, 2, np.nan])
 
-        a = SparseArray(values, kind=kind, fill_value=1)
-        b = SparseArray(rvalues, kind=kind, fill_value=2)
+        a = SparseArray(values, kind="integer", fill_value=a_fill_value)
+        b = SparseArray(rvalues, kind="block", fill_value=b_fill_value)
         self._check_numeric_ops(a, b, values, rvalues, mix, op)
 
-    def test_float_array_different_kind(self, mix, all_arithmetic_functions):
+    def test_float_array_different_kind_times_zero(self, mix, all_arithmetic_functions):
         op = all_arithmetic_functions
 
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
@@ -208,102 +199,74 @@ class TestSparseArrayArithmetics:
 
         a = SparseArray(values, kind="integer")
         b = SparseArray(rvalues, kind="block")
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
         self._check_numeric_ops(a, b * 0, values, rvalues * 0, mix, op)
 
-        a = SparseArray(values, kind="integer", fill_value=0)
-        b = SparseArray(rvalues, kind="block")
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
-
-        a = SparseArray(values, kind="integer", fill_value=0)
-        b = SparseArray(rvalues, kind="block", fill_value=0)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+    def test_float_array_comparison(self, kind, fill_values):
+        a_fill_value, b_fill_value = fill_values
+        values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
+        rvalues = np.array([2, np.nan, 2, 3, np.nan, 0, 1, 5, 2, np.nan])
 
-        a = SparseArray(values, kind="integer", fill_value=1)
-        b = SparseArray(rvalues, kind="block", fill_value=2)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        a = SparseArray(values, kind=kind, fill_value=a_fill_value)
+        b = SparseArray(rvalues, kind=kind, fill_value=b_fill_value)
+        self._check_comparison_ops(a, b, values, rvalues)
 
-    def test_float_array_comparison(self, kind):
+    def test_float_array_comparison_times_zero(self, kind):
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
         rvalues = np.array([2, np.nan, 2, 3, np.nan, 0, 1, 5, 2, np.nan])
 
         a = SparseArray(values, kind=kind)
         b = SparseArray(rvalues, kind=kind)
-        self._check_comparison_ops(a, b, values, rvalues)
         self._check_comparison_ops(a, b * 0, values, rvalues * 0)
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind)
-        self._check_comparison_ops(a, b, values, rvalues)
+    def test_int_array(self, kind, mix, all_arithmetic_functions, fill_values):
+        a_fill_value, b_fill_value = fill_values
+        op = all_arithmetic_functions
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind, fill_value=0)
-        self._check_comparison_ops(a, b, values, rvalues)
+        # have to specify dtype explicitly until fixing GH 667
+        dtype = np.int64
 
-        a = SparseArray(values, kind=kind, fill_value=1)
-        b = SparseArray(rvalues, kind=kind, fill_value=2)
-        self._check_comparison_ops(a, b, values, rvalues)
+        values = np.array([0, 1, 2, 0, 0, 0, 1, 2, 1, 0], dtype=dtype)
+        rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=dtype)
 
-    def test_int_array(self, kind, mix, all_arithmetic_functions):
-        op = all_arithmetic_functions
+        a = SparseArray(values, fill_value=a_fill_value, dtype=dtype, kind=kind)
+        assert a.dtype == SparseDtype(dtype, fill_value=a_fill_value)
+        b = SparseArray(rvalues, fill_value=b_fill_value, dtype=dtype, kind=kind)
+        assert b.dtype == SparseDtype(dtype, fill_value=b_fill_value)
+        self._check_numeric_ops(a, b, values, rvalues, mix, op)
 
-        # have to specify dtype explicitly until fixing GH 667
+    def test_int_array_times_zero(self, kind, mix, all_arithmetic_functions):
+        op = all_arithmetic_functions
         dtype = np.int64
 
         values = np.array([0, 1, 2, 0, 0, 0, 1, 2, 1, 0], dtype=dtype)
         rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=dtype)
 
         a = SparseArray(values, dtype=dtype, kind=kind)
-        assert a.dtype == SparseDtype(dtype)
         b = SparseArray(rvalues, dtype=dtype, kind=kind)
-        assert b.dtype == SparseDtype(dtype)
-
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
         self._check_numeric_ops(a, b * 0, values, rvalues * 0, mix, op)
 
-        a = SparseArray(values, fill_value=0, dtype=dtype, kind=kind)
-        assert a.dtype == SparseDtype(dtype)
-        b = SparseArray(rvalues, dtype=dtype, kind=kind)
-        assert b.dtype == SparseDtype(dtype)
-
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+    def test_int_array_comparison(self, kind, fill_values):
+        a_fill_value, b_fill_value = fill_values
+        dtype = "int64"
+        # int32 NI ATM
 
-        a = SparseArray(values, fill_value=0, dtype=dtype, kind=kind)
-        assert a.dtype == SparseDtype(dtype)
-        b = SparseArray(rvalues, fill_value=0, dtype=dtype, kind=kind)
-        assert b.dtype == SparseDtype(dtype)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        values = np.array([0, 1, 2, 0, 0, 0, 1, 2, 1, 0], dtype=dtype)
+        rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=dtype)
 
-        a = SparseArray(values, fill_value=1, dtype=dtype, kind=kind)
-        assert a.dtype == SparseDtype(dtype, fill_value=1)
-        b = SparseArray(rvalues, fill_value=2, dtype=dtype, kind=kind)
-        assert b.dtype == SparseDtype(dtype, fill_value=2)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        a = SparseArray(values, dtype=dtype, kind=kind, fill_value=a_fill_value)
+        b = SparseArray(rvalues, dtype=dtype, kind=kind, fill_value=b_fill_value)
+        self._check_comparison_ops(a, b, values, rvalues)
 
-    def test_int_array_comparison(self, kind):
+    def test_int_array_comparison_times_zero(self, kind):
         dtype = "int64"
-        # int32 NI ATM
 
         values = np.array([0, 1, 2, 0, 0, 0, 1, 2, 1, 0], dtype=dtype)
         rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=dtype)
 
         a = SparseArray(values, dtype=dtype, kind=kind)
         b = SparseArray(rvalues, dtype=dtype, kind=kind)
-        self._check_comparison_ops(a, b, values, rvalues)
         self._check_comparison_ops(a, b * 0, values, rvalues * 0)
 
-        a = SparseArray(values, dtype=dtype, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, dtype=dtype, kind=kind)
-        self._check_comparison_ops(a, b, values, rvalues)
-
-        a = SparseArray(values, dtype=dtype, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, dtype=dtype, kind=kind, fill_value=0)
-        self._check_comparison_ops(a, b, values, rvalues)
-
-        a = SparseArray(values, dtype=dtype, kind=kind, fill_value=1)
-        b = SparseArray(rvalues, dtype=dtype, kind=kind, fill_value=2)
-        self._check_comparison_ops(a, b, values, rvalues)
-
     @pytest.mark.parametrize("fill_value", [True, False, np.nan])
     def test_bool_same_index(self, kind, fill_value):
         # GH 14000
@@ -326,7 +289,23 @@ class TestSparseArrayArithmetics:
         b = SparseArray(rvalues, kind=kind, dtype=np.bool_, fill_value=fill_value)
         self._check_logical_ops(a, b, values, rvalues)
 
-    def test_mixed_array_float_int(self, kind, mix, all_arithmetic_functions, request):
+    def test_mixed_array_float_int(
+        self, kind, mix, all_arithmetic_functions, fill_values
+    ):
+        a_fill_value, b_fill_value = fill_values
+        op = all_arithmetic_functions
+        rdtype = "int64"
+        values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
+        rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=rdtype)
+
+        a = SparseArray(values, kind=kind, fill_value=a_fill_value)
+        b = SparseArray(rvalues, kind=kind, fill_value=b_fill_value)
+        assert b.dtype == SparseDtype(rdtype, fill_value=b_fill_value)
+        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+
+    def test_mixed_array_float_int_times_zero(
+        self, kind, mix, all_arithmetic_functions
+    ):
         op = all_arithmetic_functions
         rdtype = "int64"
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
@@ -334,55 +313,31 @@ class TestSparseArrayArithmetics:
 
         a = SparseArray(values, kind=kind)
         b = SparseArray(rvalues, kind=kind)
-        assert b.dtype == SparseDtype(rdtype)
-
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
         self._check_numeric_ops(a, b * 0, values, rvalues * 0, mix, op)
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind)
-        assert b.dtype == SparseDtype(rdtype)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+    def test_mixed_array_comparison(self, kind, fill_values):
+        a_fill_value, b_fill_value = fill_values
+        rdtype = "int64"
+        # int32 NI ATM
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind, fill_value=0)
-        assert b.dtype == SparseDtype(rdtype)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
+        rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=rdtype)
 
-        a = SparseArray(values, kind=kind, fill_value=1)
-        b = SparseArray(rvalues, kind=kind, fill_value=2)
-        assert b.dtype == SparseDtype(rdtype, fill_value=2)
-        self._check_numeric_ops(a, b, values, rvalues, mix, op)
+        a = SparseArray(values, kind=kind, fill_value=a_fill_value)
+        b = SparseArray(rvalues, kind=kind, fill_value=b_fill_value)
+        assert b.dtype == SparseDtype(rdtype, fill_value=b_fill_value)
+        self._check_comparison_ops(a, b, values, rvalues)
 
-    def test_mixed_array_comparison(self, kind):
+    def test_mixed_array_comparison_times_zero(self, kind):
         rdtype = "int64"
-        # int32 NI ATM
 
         values = np.array([np.nan, 1, 2, 0, np.nan, 0, 1, 2, 1, np.nan])
         rvalues = np.array([2, 0, 2, 3, 0, 0, 1, 5, 2, 0], dtype=rdtype)
 
         a = SparseArray(values, kind=kind)
         b = SparseArray(rvalues, kind=kind)
-        assert b.dtype == SparseDtype(rdtype)
-
-        self._check_comparison_ops(a, b, values, rvalues)
         self._check_comparison_ops(a, b * 0, values, rvalues * 0)
 
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind)
-        assert b.dtype == SparseDtype(rdtype)
-        self._check_comparison_ops(a, b, values, rvalues)
-
-        a = SparseArray(values, kind=kind, fill_value=0)
-        b = SparseArray(rvalues, kind=kind, fill_value=0)
-        assert b.dtype == SparseDtype(rdtype)
-        self._check_comparison_ops(a, b, values, rvalues)
-
-        a = SparseArray(values, kind=kind, fill_value=1)
-        b = SparseArray(rvalues, kind=kind, fill_value=2)
-        assert b.dtype == SparseDtype(rdtype, fill_value=2)
-        self._check_comparison_ops(a, b, values, rvalues)
-
     def test_xor(self):
         s = SparseArray([True, True, False, False])
         t = SparseArray([True, False, True, False])
@@ -418,25 +373,20 @@ def test_with_zerodim_ndarray():
 
 
 @pytest.mark.parametrize("ufunc", [np.abs, np.exp])
-@pytest.mark.parametrize(
-    "arr", [SparseArray([0, 0, -1, 1]), SparseArray([None, None, -1, 1])]
-)
-def test_ufuncs(ufunc, arr):
+@pytest.mark.parametrize("values", [[0, 0, -1, 1], [None, None, -1, 1]])
+def test_ufuncs(ufunc, values):
+    arr = SparseArray(values)
     result = ufunc(arr)
     fill_value = ufunc(arr.fill_value)
     expected = SparseArray(ufunc(np.asarray(arr)), fill_value=fill_value)
     tm.assert_sp_array_equal(result, expected)
 
 
-@pytest.mark.parametrize(
-    "a, b",
-    [
-        (SparseArray([0, 0, 0]), np.array([0, 1, 2])),
-        (SparseArray([0, 0, 0], fill_value=1), np.array([0, 1, 2])),
-    ],
-)
+@pytest.mark.parametrize("fill_value", [0, 1])
 @pytest.mark.parametrize("ufunc", [np.add, np.greater])
-def test_binary_ufuncs(ufunc, a, b):
+def test_binary_ufuncs(ufunc, fill_value):
+    a = SparseArray([0, 0, 0], fill_value=fill_value)
+    b = np.array([0, 1, 2])
     # can't say anything about fill value here.
     result = ufunc(a, b)
     expected = ufunc(np.asarray(a), np.asarray(b))
@@ -87,6 +87,14 @@ class TestIsNA:
         expected = np.ones(shape=shape, dtype=bool)
         tm.assert_numpy_array_equal(result, expected)
 
+    @pytest.mark.parametrize("dtype", ["int64", "uint8", "bool"])
+    @pytest.mark.parametrize("shape", [(4, 0), (4,), (2, 3)])
+    def test_non_nullable_ndarray(self, dtype, shape):
+        arr = np.ones(shape=shape, dtype=dtype)
+        result = isna(arr)
+        expected = np.zeros(shape=shape, dtype=bool)
+        tm.assert_numpy_array_equal(result, expected)
+
     @pytest.mark.parametrize("isna_f", [isna, isnull])
     def test_isna_isnull(self, isna_f):
         assert not isna_f(1.0)
@@ -406,6 +414,26 @@ def test_array_equivalent(dtype_equal):
     )
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+@pytest.mark.parametrize("nan_fraction", [0.0, 0.01, 0.5, 1.0])
+@pytest.mark.parametrize("dtype_equal", [True, False])
+def test_array_equivalent_float_with_nans(dtype, nan_fraction, dtype_equal):
+    rng = np.random.default_rng(2)
+    left = rng.standard_normal(1000).astype(dtype)
+    left[rng.random(1000) < nan_fraction] = np.nan
+    right = left.copy()
+    assert array_equivalent(left, right, dtype_equal=dtype_equal)
+
+    # a NaN on only one side
+    right[0] = np.nan if not np.isnan(left[0]) else 1.0
+    assert not array_equivalent(left, right, dtype_equal=dtype_equal)
+
+    # a differing value next to matching NaNs
+    right = left.copy()
+    right[-1] = 2.0 if left[-1] != 2.0 else 3.0
+    assert not array_equivalent(left, right, dtype_equal=dtype_equal)
+
+
 @pytest.mark.parametrize("dtype_equal", [True, False])
 def test_array_equivalent_tdi(dtype_equal):
     assert array_equivalent(
@@ -495,6 +523,31 @@ def test_array_equivalent_different_dtype_but_equal():
     assert array_equivalent(np.array([1, 2]), np.array([1.0, 2.0]))
 
 
+@pytest.mark.parametrize("strict_nan", [True, False])
+@pytest.mark.parametrize("dtype_equal", [True, False])
+def test_array_equivalent_same_object(strict_nan, dtype_equal):
+    arr = np.array([np.nan, None, 1], dtype=object)
+    assert array_equivalent(arr, arr, strict_nan=strict_nan, dtype_equal=dtype_equal)
+
+
+@pytest.mark.parametrize("dtype_equal", [True, False])
+def test_array_equivalent_same_object_strict_nan(dtype_equal):
+    # the result must not depend on whether both arguments are the same object
+    arr = np.array([NaT, pd.NA, None], dtype=object)
+    result = array_equivalent(arr, arr, strict_nan=True, dtype_equal=dtype_equal)
+    expected = array_equivalent(
+        arr, arr.copy(), strict_nan=True, dtype_equal=dtype_equal
+    )
+    assert result is expected is False
+
+
+@pytest.mark.parametrize("dtype", [object, "datetime64[ns]", np.float64])
+def test_array_equivalent_empty_object(dtype):
+    left = np.array([], dtype=object)
+    right = np.array([], dtype=dtype)
+    assert array_equivalent(left, right)
+
+
 @pytest.mark.parametrize(
     "lvalue, rvalue",
     [
@@ -884,3 +937,23 @@ class TestIsValidNAForDtype:
         assert not is_valid_na_for_dtype(NaT, dtype)
         assert not is_valid_na_for_dtype(np.datetime64("NaT", "ns"), dtype)
         assert not is_valid_na_for_dtype(np.timedelta64("NaT", "ns"), dtype)
+
+    @pytest.mark.parametrize("obj", [None, libmissing.NA])
+    @pytest.mark.parametrize(
+        "dtype",
+        [
+            np.dtype("M8[ns]"),
+            np.dtype("m8[ns]"),
+            np.dtype("int64"),
+            np.dtype("float64"),
+            np.dtype(bool),
+            np.dtype(object),
+            np.dtype(str),
+            PeriodDtype("D"),
+            IntervalDtype("int64", "left"),
+            CategoricalDtype(categories=[0, 1, 2]),
+            DatetimeTZDtype(tz="UTC"),
+        ],
+    )
+    def test_is_valid_na_for_dtype_none_and_na(self, obj, dtype):
+        assert is_valid_na_for_dtype(obj, dtype)
@@ -16,12 +16,17 @@ from pandas.compat import (
 
 import pandas as pd
 import pandas._testing as tm
+from pandas.core.interchange.buffer import PandasBuffer
 from pandas.core.interchange.column import PandasColumn
 from pandas.core.interchange.dataframe_protocol import (
     ColumnNullType,
     DtypeKind,
 )
-from pandas.core.interchange.from_dataframe import from_dataframe
+from pandas.core.interchange.from_dataframe import (
+    bitmask_to_bool_ndarray,
+    from_dataframe,
+    parse_datetime_format_str,
+)
 from pandas.core.interchange.utils import ArrowCTypes
 
 
@@ -49,6 +54,13 @@ def test_categorical_dtype(data):
     tm.assert_frame_equal(df, from_dataframe(df.__dataframe__()))
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_categorical_with_missing(ordered):
+    df = pd.DataFrame({"A": pd.Categorical(["a", None, "b", "a"], ordered=ordered)})
+    result = from_dataframe(df.__dataframe__())
+    tm.assert_frame_equal(result, df)
+
+
 def test_categorical_pyarrow():
     # GH 49889
     pa = pytest.importorskip("pyarrow", "11.0.0")
@@ -64,6 +76,27 @@ def test_categorical_pyarrow():
     tm.assert_frame_equal(result, expected)
 
 
+def test_categorical_unsigned_codes_with_missing_pyarrow():
+    pa = pytest.importorskip("pyarrow", "11.0.0")
+
+    # more than 127 categories, so the codes are not stored as int8; the code
+    # in the masked-out slot and the last code are outside of the categories
+    categories = [f"c{i}" for i in range(200)]
+    validity = pa.array([True, False, True, True]).buffers()[1]
+    data = pa.py_buffer(np.array([0, 255, 1, 255], dtype=np.uint8).tobytes())
+    indices = pa.Array.from_buffers(pa.uint8(), 4, [validity, data])
+    arr = pa.DictionaryArray.from_arrays(indices, pa.array(categories), safe=False)
+    table = pa.table({"arr": arr})
+    result = from_dataframe(table.__dataframe__())
+    expected = pd.DataFrame(
+        {"arr": pd.Categorical(["c0", None, "c1", None], categories=categories)}
+    )
+    tm.assert_frame_equal(result, expected)
+    tm.assert_numpy_array_equal(
+        result["arr"].cat.codes.to_numpy(), np.array([0, -1, 1, -1], dtype=np.int16)
+    )
+
+
 def test_empty_categorical_pyarrow():
     # https://github.com/pandas-dev/pandas/issues/53077
     pa = pytest.importorskip("pyarrow", "11.0.0")
@@ -91,6 +124,17 @@ def test_large_string_pyarrow():
     assert pa.Table.equals(pa.interchange.from_dataframe(result), table)
 
 
+@pytest.mark.parametrize("type_name", ["string", "large_string"])
+def test_sliced_string_with_nulls_pyarrow(type_name):
+    pa = pytest.importorskip("pyarrow", "11.0.0")
+
+    arr = pa.array(["a", None, "h\u00e9llo", "", "z"], type=getattr(pa, type_name)())
+    table = pa.table({"arr": arr}).slice(1, 3)
+    result = from_dataframe(table.__dataframe__())
+    expected = pd.DataFrame({"arr": [np.nan, "h\u00e9llo", ""]})
+    tm.assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     ("offset", "length", "expected_values"),
     [
@@ -117,6 +161,27 @@ def test_bitmasks_pyarrow(offset, length, expected_values):
     assert pa.Table.equals(pa.interchange.from_dataframe(result), table)
 
 
+def test_bitmasks_with_nulls_pyarrow():
+    # integer columns with nulls are cast to float, boolean columns stay bool
+    # and their nulls are filled with False
+    pa = pytest.importorskip("pyarrow", "11.0.0")
+
+    table = pa.table({"int": [1, None, 3], "bool": [True, None, False]})
+    result = from_dataframe(table.__dataframe__())
+    expected = pd.DataFrame({"int": [1.0, np.nan, 3.0], "bool": [True, False, False]})
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("offset", [0, 1, 7, 8, 13])
+@pytest.mark.parametrize("length", [0, 1, 8, 11])
+def test_bitmask_to_bool_ndarray(offset, length):
+    bits = np.random.default_rng(2).integers(0, 2, size=32).astype(bool)
+    buffer = PandasBuffer(np.packbits(bits, bitorder="little"))
+    result = bitmask_to_bool_ndarray(buffer, length=length, offset=offset)
+    expected = bits[offset : offset + length]
+    tm.assert_numpy_array_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -243,6 +308,19 @@ def test_string():
     assert col.describe_null == (ColumnNullType.USE_BYTEMASK, 0)
 
 
+@pytest.mark.parametrize("offset", [0, 1])
+def test_string_without_pyarrow(monkeypatch, offset):
+    # the strings are assembled row by row when pyarrow isn't available
+    monkeypatch.setattr(
+        "pandas.core.interchange.from_dataframe.import_optional_dependency",
+        lambda *args, **kwargs: None,
+    )
+    df = pd.DataFrame({"A": ["a", None, "h\u00e9llo", ""]}, dtype=object)[offset:]
+    result = from_dataframe(df.__dataframe__())
+    expected = pd.DataFrame({"A": ["a", np.nan, "h\u00e9llo", ""]})[offset:]
+    tm.assert_frame_equal(result, expected)
+
+
 def test_nonstring_object():
     df = pd.DataFrame({"A": ["a", 10, 1.0, ()]})
     col = df.__dataframe__().get_column_by_name("A")
@@ -262,6 +340,16 @@ def test_datetime():
     tm.assert_frame_equal(df, from_dataframe(df.__dataframe__()))
 
 
+@pytest.mark.parametrize("dtype", [np.int32, np.int64])
+def test_parse_datetime_format_str_days(dtype):
+    data = np.array([-3528, 0, 21916], dtype=dtype)
+    result = parse_datetime_format_str("tdD", data)
+    expected = np.array(
+        ["1960-05-05", "1970-01-01", "2030-01-02"], dtype="datetime64[s]"
+    )
+    tm.assert_numpy_array_equal(result, expected)
+
+
 def test_categorical_to_numpy_dlpack():
     # https://github.com/pandas-dev/pandas/issues/48393
     df = pd.DataFrame({"A": pd.Categorical(["a", "b", "a"])})
@@ -296,6 +384,28 @@ def test_multi_chunk_pyarrow() -> None:
         pd.api.interchange.from_dataframe(table, allow_copy=False)
 
 
+def test_multi_chunk_mixed_columns_pyarrow() -> None:
+    pa = pytest.importorskip("pyarrow", "11.0.0")
+    first = pa.table({"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]})
+    second = pa.table(
+        {
+            "a": pa.array([3, None], pa.int64()),
+            "b": pa.array([None, "z"], pa.string()),
+            "c": [3.5, 4.5],
+        }
+    )
+    table = pa.concat_tables([first, second])
+    result = pd.api.interchange.from_dataframe(table)
+    expected = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, np.nan],
+            "b": ["x", "y", np.nan, "z"],
+            "c": [1.5, 2.5, 3.5, 4.5],
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
 def test_multi_chunk_column() -> None:
     pytest.importorskip("pyarrow", "11.0.0")
     ser = pd.Series([1, 2, None], dtype="Int64[pyarrow]")
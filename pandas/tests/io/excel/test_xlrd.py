@@ -36,6 +36,16 @@ def test_read_xlrd_book(read_ext_xlrd, datapath):
     tm.assert_frame_equal(result, expected)
 
 
+def test_read_xlrd_file_handle_and_buffer(datapath):
+    # local file handles are memory-mapped, other buffers are read
+    path = datapath("io", "data", "excel", "test1.xls")
+    with open(path, "rb") as f:
+        result = pd.read_excel(f, engine="xlrd", index_col=0)
+        f.seek(0)
+        expected = pd.read_excel(io.BytesIO(f.read()), engine="xlrd", index_col=0)
+    tm.assert_frame_equal(result, expected)
+
+
 def test_read_xlsx_fails(datapath):
     # GH 29375
     from xlrd.biffh import XLRDError
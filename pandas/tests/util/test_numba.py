@@ -3,6 +3,7 @@ import pytest
 import pandas.util._test_decorators as td
 
 from pandas import option_context
+from pandas.core.util.numba_ import jit_user_function
 
 
 @td.skip_if_installed("numba")
@@ -10,3 +11,12 @@ def test_numba_not_installed_option_context():
     with pytest.raises(ImportError, match="Missing optional"):
         with option_context("compute.use_numba", True):
             pass
+
+
+@td.skip_if_no("numba")
+def test_jit_user_function_cached():
+    def f(x):
+        return x + 1
+
+    result = jit_user_function(f)
+    assert jit_user_function(f) is result